@@ -56,9 +56,17 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     return parser.parse_args(args)
 
 
-def main() -> int:
-    """Main entry point for the qless-solver CLI."""
-    args = parse_args()
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main entry point for the qless-solver CLI.
+
+    Args:
+        argv: Command line arguments, defaulting to ``sys.argv[1:]``
+
+    Returns:
+        The process exit code
+    """
+    args = parse_args(argv)
 
     # Handle random roll generation
     if args.generate:
@@ -6,10 +6,9 @@ to manipulate them.
 """
 
 import random
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field, field_validator
-
 # The actual letter distribution on the Q-Less dice, sourced from BoardGameGeek
 # Each list represents one die with its six sides
 QLESS_DICE = [
@@ -28,49 +27,62 @@ QLESS_DICE = [
 ]
 
 
-class Die(BaseModel):
-    """Representation of a single die in the Q-Less game."""
+@dataclass(slots=True)
+class Die:
+    """
+    Representation of a single die in the Q-Less game.
 
-    sides: List[str] = Field(description="The 6 sides of the die with their letters")
-    current_face: Optional[str] = Field(
-        None, description="The currently showing face after a roll"
-    )
+    Attributes:
+        sides: The 6 sides of the die with their letters
+        current_face: The currently showing face after a roll
+    """
 
-    @field_validator("sides")
-    @classmethod
-    def validate_sides(cls, v: List[str]) -> List[str]:
+    sides: List[str]
+    current_face: Optional[str] = None
+
+    def __post_init__(self) -> None:
         """Validate that a die has exactly 6 sides."""
-        if len(v) != 6:
+        if len(self.sides) != 6:
             raise ValueError("A die must have exactly 6 sides")
-        return v
 
-    def roll(self, use_face_index: Optional[int] = None) -> str:
+    def roll(
+        self,
+        use_face_index: Optional[int] = None,
+        rng: Optional[random.Random] = None,
+    ) -> str:
         """
         Roll the die to get a random side.
 
         Args:
             use_face_index: Optional index to use instead of random roll (for testing)
+            rng: Optional random generator to roll with instead of the
+                 module-level one (for reproducible rolls)
 
         Returns:
             The letter on the rolled face
         """
         if use_face_index is not None and 0 <= use_face_index < 6:
             self.current_face = self.sides[use_face_index]
+        elif rng is not None:
+            self.current_face = rng.choice(self.sides)
         else:
             self.current_face = random.choice(self.sides)
 
         return self.current_face
 
 
-class DiceSet(BaseModel):
-    """Representation of a set of dice for the Q-Less game."""
+@dataclass(slots=True)
+class DiceSet:
+    """
+    Representation of a set of dice for the Q-Less game.
 
-    dice: List[Die] = Field(description="The collection of dice in the set")
-    roll_result: List[str] = Field(
-        default_factory=list, description="The result of the last roll"
-    )
+    Attributes:
+        dice: The collection of dice in the set
+        roll_result: The result of the last roll
+    """
 
-    model_config = {"arbitrary_types_allowed": True}
+    dice: List[Die]
+    roll_result: List[str] = field(default_factory=list)
 
     @classmethod
     def from_config(cls, dice_config: Optional[List[List[str]]] = None) -> "DiceSet":
@@ -87,7 +99,7 @@ class DiceSet(BaseModel):
         if dice_config is None:
             dice_config = QLESS_DICE
 
-        dice = [Die(sides=sides, current_face=None) for sides in dice_config]
+        dice = [Die(sides=list(sides)) for sides in dice_config]
         return cls(dice=dice)
 
     def roll(self, use_face_indices: Optional[List[int]] = None) -> List[str]:
@@ -102,8 +114,12 @@ class DiceSet(BaseModel):
         """
         self.roll_result = []
 
+        # One draw over all 6**n outcomes; its base-6 digits are independent,
+        # uniform face indices, one per die
+        outcome = random.randrange(6 ** len(self.dice))
+
         for i, die in enumerate(self.dice):
-            face_index = None
+            outcome, face_index = divmod(outcome, 6)
             if use_face_indices is not None and i < len(use_face_indices):
                 face_index = use_face_indices[i]
 
@@ -1,15 +1,70 @@
 """
 Dictionary module for the qless-solver.
 Provides functions for validating words and finding valid words.
+
+Solvers consume candidate words as ``ValidWord`` records (see
+``to_valid_words``), ordered longest first. Each record carries the word's
+packed letter counts from ``letter_mask``. A solver tracks the letters it has
+left as a mask of the same form, so ``mask_contains(remaining, word.mask)``
+tells whether a word still fits and ``remaining - word.mask`` spends it.
 """
 
+import functools
+import hashlib
+import itertools
+import os
+import pickle
+import threading
+from bisect import bisect_left
 from collections import Counter
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Set
+from typing import FrozenSet, Iterable, List, Optional, Set
+
+from platformdirs import user_cache_dir
+
+__all__ = [
+    "LETTER_MASK_GUARDS",
+    "Dictionary",
+    "ValidWord",
+    "add_custom_words",
+    "can_form_word",
+    "get_valid_words",
+    "is_valid_word",
+    "letter_mask",
+    "load_dictionary",
+    "mask_contains",
+    "to_valid_words",
+]
 
 # Global cache for the dictionary
 _DICTIONARY: Optional[Set[str]] = None
 
+# Sorted view of the dictionary, used as a prefix trie for word enumeration
+_WORD_INDEX: Optional[List[str]] = None
+
+# Identifies the current contents of the dictionary. Memoized lookups are
+# keyed on it, so a result computed before add_custom_words changed the
+# dictionary can never be served afterwards. Values come from _GENERATIONS
+# and are never reused.
+_GENERATIONS = itertools.count(1)
+_DICTIONARY_GENERATION = 0
+
+# Serializes first-time loading; re-entrant because building the index loads
+# the dictionary
+_LOAD_LOCK = threading.RLock()
+
+_ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+
+# Letter masks pack one 5-bit lane per letter: four bits of count plus a
+# guard bit that absorbs the borrow when a lane is over-subtracted.
+_LANE_BITS = 5
+_MAX_LANE_COUNT = 15
+LETTER_MASK_GUARDS = sum(1 << (_LANE_BITS * i + 4) for i in range(26))
+
+# Bump when the parsing rules change so that stale caches are ignored
+_CACHE_VERSION = 1
+
 
 def load_dictionary(
     dictionary_path: Optional[Path] = None,
@@ -23,63 +78,183 @@ def load_dictionary(
     Returns:
         A set of valid words.
     """
-    global _DICTIONARY
+    global _DICTIONARY, _WORD_INDEX
 
-    # Use cached dictionary if available
+    # Use cached dictionary if available; once published it is never
+    # replaced, so reading it needs no lock
     if _DICTIONARY is not None:
         return _DICTIONARY
 
-    # Use the provided path or default to dictionary.txt in the root directory
-    if dictionary_path is None:
-        dictionary_path = Path(__file__).parent.parent.parent / "dictionary.txt"
+    with _LOAD_LOCK:
+        # Another thread may have finished loading while we waited
+        if _DICTIONARY is not None:
+            return _DICTIONARY
+
+        # Use the provided path or default to dictionary.txt in the root directory
+        if dictionary_path is None:
+            dictionary_path = Path(__file__).parent.parent.parent / "dictionary.txt"
+
+        # Skip parsing entirely when a fresh pre-parsed copy is on disk
+        cached_words = _read_cache(dictionary_path)
+        if cached_words is not None:
+            _WORD_INDEX = cached_words
+            _DICTIONARY = set(cached_words)
+            return _DICTIONARY
+
+        try:
+            with open(dictionary_path, "r", encoding="utf-8") as f:
+                text = f.read()
+
+            # Each line has format "WORD definition..." or just "WORD". Lower-case
+            # the whole file once and keep the part of each line before the first
+            # space, so the per-line work stays inside C string methods.
+            words = {
+                # Remove any non-alphabetic characters (rare, so check first)
+                word if word.isalpha() else "".join(c for c in word if c.isalpha())
+                for word in (
+                    line.partition(" ")[0] for line in text.lower().splitlines()
+                )
+            }
+            words.discard("")  # Only keep non-empty words
+            _WORD_INDEX = _build_trie(words)
+            _write_cache(dictionary_path, _WORD_INDEX)
+        except FileNotFoundError:
+            print(
+                f"Dictionary file not found at {dictionary_path}. Using built-in fallback dictionary."
+            )
+            # Fallback to a small built-in dictionary for testing purposes
+            words = {
+                "apple",
+                "banana",
+                "cherry",
+                "date",
+                "fig",
+                "grape",
+                "are",
+                "ran",
+                "ear",
+                "near",
+                "gear",
+                "ran",
+                "eat",
+                "tea",
+                "ate",
+                "seat",
+                "rate",
+                "tear",
+                "gate",
+                "art",
+                "rat",
+                "tar",
+                "tare",
+                "stare",
+                "depart",
+            }
+
+        # Publish last so lock-free readers never see a partially built set
+        _DICTIONARY = words
+
+    return _DICTIONARY
+
+
+def _cache_path(dictionary_path: Path) -> Path:
+    """
+    Get the location of the parsed-word cache for a dictionary file.
+
+    Args:
+        dictionary_path: Path to the dictionary text file.
+
+    Returns:
+        Path of the cache file inside the user cache directory.
+    """
+    source = str(Path(dictionary_path).resolve())
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:16]
+    file_name = f"{Path(dictionary_path).stem}-{digest}-v{_CACHE_VERSION}.pkl"
+    return Path(user_cache_dir("qless-solver")) / file_name
 
-    _DICTIONARY = set()
 
+def _read_cache(dictionary_path: Path) -> Optional[List[str]]:
+    """
+    Read the parsed words for a dictionary file from the cache.
+
+    Args:
+        dictionary_path: Path to the dictionary text file.
+
+    Returns:
+        The sorted words, or None if there is no cache newer than the file.
+    """
+    cache_path = _cache_path(dictionary_path)
     try:
-        with open(dictionary_path, "r", encoding="utf-8") as f:
-            for line in f:
-                # Each line has format "WORD definition..." or just "WORD"
-                # Extract just the word part (before the first space)
-                if line.strip():
-                    word = line.split(" ", 1)[0].lower()
-                    # Remove any non-alphabetic characters
-                    word = "".join(c for c in word if c.isalpha())
-                    if word:  # Only add non-empty words
-                        _DICTIONARY.add(word)
-    except FileNotFoundError:
-        print(
-            f"Dictionary file not found at {dictionary_path}. Using built-in fallback dictionary."
-        )
-        # Fallback to a small built-in dictionary for testing purposes
-        _DICTIONARY = {
-            "apple",
-            "banana",
-            "cherry",
-            "date",
-            "fig",
-            "grape",
-            "are",
-            "ran",
-            "ear",
-            "near",
-            "gear",
-            "ran",
-            "eat",
-            "tea",
-            "ate",
-            "seat",
-            "rate",
-            "tear",
-            "gate",
-            "art",
-            "rat",
-            "tar",
-            "tare",
-            "stare",
-            "depart",
-        }
+        if cache_path.stat().st_mtime < Path(dictionary_path).stat().st_mtime:
+            return None
+        with open(cache_path, "rb") as f:
+            words = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
 
-    return _DICTIONARY
+    return words if isinstance(words, list) else None
+
+
+def _write_cache(dictionary_path: Path, words: List[str]) -> None:
+    """
+    Write the parsed words for a dictionary file to the cache.
+
+    Failures are ignored, since the cache only speeds up later loads.
+
+    Args:
+        dictionary_path: Path to the dictionary text file.
+        words: The sorted words parsed from the file.
+    """
+    cache_path = _cache_path(dictionary_path)
+    temp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temp_path, "wb") as f:
+            pickle.dump(words, f, protocol=5)
+        # Atomic rename so concurrent readers never see a partial file
+        temp_path.replace(cache_path)
+    except OSError:
+        pass
+
+
+def _build_trie(words: Set[str]) -> List[str]:
+    """
+    Build the prefix index used to enumerate dictionary words.
+
+    The index is the word list in lexicographic order. Every trie node (a
+    prefix) then corresponds to a contiguous slice of the list which can be
+    located with ``bisect``, so the index costs one pointer per word on top of
+    the dictionary set while still supporting prefix-pruned traversal.
+
+    Args:
+        words: The words to index.
+
+    Returns:
+        The words sorted lexicographically.
+    """
+    return sorted(words)
+
+
+def _get_word_index(dictionary_path: Optional[Path] = None) -> List[str]:
+    """
+    Get the sorted word index, building it on first use.
+
+    Args:
+        dictionary_path: Path to the dictionary file.
+
+    Returns:
+        The dictionary words sorted lexicographically.
+    """
+    global _WORD_INDEX
+
+    word_index = _WORD_INDEX
+    if word_index is None:
+        with _LOAD_LOCK:
+            if _WORD_INDEX is None:
+                _WORD_INDEX = _build_trie(load_dictionary(dictionary_path))
+            word_index = _WORD_INDEX
+
+    return word_index
 
 
 def is_valid_word(word: str, min_length: int = 3) -> bool:
@@ -111,15 +286,93 @@ def can_form_word(word: str, available_letters: Counter) -> bool:
     Returns:
         True if the word can be formed, False otherwise.
     """
-    word_counter = Counter(word.lower())
+    word = word.lower()
 
-    for letter, count in word_counter.items():
-        if available_letters[letter] < count:
+    # Count each distinct letter in place rather than building a Counter
+    for letter in set(word):
+        if available_letters[letter] < word.count(letter):
             return False
 
     return True
 
 
+def letter_mask(letters: str) -> int:
+    """
+    Pack the letter counts of a string into a single integer.
+
+    Each letter a-z owns a 5-bit lane holding its count, so multiset
+    containment can be tested with one subtraction (see ``mask_contains``).
+
+    Args:
+        letters: The letters to encode.
+
+    Returns:
+        The packed letter counts.
+
+    Raises:
+        ValueError: If a character is outside a-z or occurs more than 15 times.
+    """
+    mask = 0
+    for letter, count in Counter(letters.lower()).items():
+        position = ord(letter) - 97
+        if not 0 <= position < 26:
+            raise ValueError(f"Cannot encode non-alphabetic character {letter!r}")
+        if count > _MAX_LANE_COUNT:
+            raise ValueError(f"Letter {letter!r} occurs more than 15 times")
+        mask |= count << (_LANE_BITS * position)
+    return mask
+
+
+def mask_contains(available_mask: int, word_mask: int) -> bool:
+    """
+    Check if the letters of one mask are all available in another.
+
+    Args:
+        available_mask: Packed counts of the available letters.
+        word_mask: Packed counts of the letters needed.
+
+    Returns:
+        True if no lane of ``word_mask`` exceeds ``available_mask``.
+    """
+    guarded = available_mask | LETTER_MASK_GUARDS
+    return (guarded - word_mask) & LETTER_MASK_GUARDS == LETTER_MASK_GUARDS
+
+
+@dataclass(frozen=True, slots=True)
+class ValidWord:
+    """
+    A candidate word annotated for the solvers.
+
+    Attributes:
+        text: The word itself
+        mask: Packed letter counts of the word (see ``letter_mask``)
+        length: Number of letters in the word
+    """
+
+    text: str
+    mask: int
+    length: int
+
+
+def to_valid_words(words: Iterable[str]) -> List[ValidWord]:
+    """
+    Annotate words with their letter masks for the solvers.
+
+    Args:
+        words: Words made up of the letters a-z.
+
+    Returns:
+        The annotated words, longest first and alphabetical within a length.
+    """
+    return sorted(
+        (
+            ValidWord(text=word, mask=letter_mask(word), length=len(word))
+            for word in words
+        ),
+        key=lambda valid_word: (-valid_word.length, valid_word.text),
+    )
+
+
 def get_valid_words(
     letters: str,
     min_length: int = 3,
@@ -136,15 +389,82 @@ def get_valid_words(
     Returns:
         Set of valid words that can be formed.
     """
-    dictionary = load_dictionary(dictionary_path)
-    available_letters = Counter(letters.lower())
+    # The result only depends on the multiset of letters, not their order
+    letters_sorted = "".join(sorted(letters.lower()))
+    return set(
+        _get_valid_words_cached(
+            letters_sorted, min_length, dictionary_path, _DICTIONARY_GENERATION
+        )
+    )
+
 
-    # Filter the dictionary to find words that can be formed
-    valid_words = set()
-    for word in dictionary:
-        if len(word) >= min_length and can_form_word(word, available_letters):
-            valid_words.add(word)
+@functools.lru_cache(maxsize=1024)
+def _get_valid_words_cached(
+    letters_sorted: str,
+    min_length: int,
+    dictionary_path: Optional[Path],
+    generation: int,
+) -> FrozenSet[str]:
+    """
+    Memoized core of ``get_valid_words``, keyed on the sorted letters.
+
+    ``generation`` is the dictionary generation read before the lookup
+    started. ``add_custom_words`` moves to a new generation after resetting
+    the index, so a lookup that raced with it is stored under the old key
+    and is never returned for the updated dictionary.
+    """
+    return frozenset(
+        _find_words(_get_word_index(dictionary_path), letters_sorted, min_length)
+    )
+
+
+def _find_words(word_index: List[str], letters: str, min_length: int) -> Set[str]:
+    """
+    Enumerate the indexed words that can be formed from the given letters.
 
+    Performs a depth-first walk over the prefixes of ``word_index`` while
+    spending a per-letter budget, so a whole subtree of words is skipped as
+    soon as its prefix needs a letter that is no longer available.
+
+    Args:
+        word_index: Words sorted lexicographically (see ``_build_trie``).
+        letters: String of available letters.
+        min_length: Minimum word length.
+
+    Returns:
+        Set of valid words that can be formed.
+    """
+    # Fixed-size per-letter budget; indexing it is far cheaper than a Counter
+    available = bytearray(26)
+    for letter in letters.lower():
+        position = ord(letter) - 97
+        if 0 <= position < 26 and available[position] < 255:
+            available[position] += 1
+    present = [position for position in range(26) if available[position]]
+
+    valid_words: Set[str] = set()
+
+    def walk(prefix: str, lo: int, hi: int) -> None:
+        for position in present:
+            if not available[position]:
+                continue
+
+            child = prefix + _ALPHABET[position]
+            start = bisect_left(word_index, child, lo, hi)
+            if start == hi or not word_index[start].startswith(child):
+                # No dictionary word continues with this letter
+                continue
+            # Words starting with ``child`` end before the next sibling prefix
+            end = bisect_left(word_index, prefix + chr(98 + position), start, hi)
+
+            if len(child) >= min_length and word_index[start] == child:
+                valid_words.add(child)
+
+            available[position] -= 1
+            walk(child, start, end)
+            available[position] += 1
+
+    walk("", 0, len(word_index))
     return valid_words
 
 
@@ -155,9 +475,20 @@ def add_custom_words(words: Set[str]) -> None:
     Args:
         words: Set of words to add.
     """
+    global _WORD_INDEX, _DICTIONARY_GENERATION
+
     dictionary = load_dictionary()
-    for word in words:
-        dictionary.add(word.lower())
+
+    # Hold the load lock so a concurrent _get_word_index cannot build an
+    # index from a half-updated set, or publish one that misses these words
+    with _LOAD_LOCK:
+        for word in words:
+            dictionary.add(word.lower())
+
+        # The sorted index is rebuilt lazily on the next enumeration. Move to
+        # a new generation last, so any lookup keyed on it sees the reset.
+        _WORD_INDEX = None
+        _DICTIONARY_GENERATION = next(_GENERATIONS)
 
 
 class Dictionary:
@@ -173,3 +504,24 @@ class Dictionary:
     def load_dictionary(self, path: Path) -> None:
         """Reload the dictionary from ``path``."""
         self.words = load_dictionary(path)
+
+    def find_words(self, letters: str, min_length: int = 3) -> Set[str]:
+        """Return every word in this dictionary that can be formed from ``letters``."""
+        if self.words is _DICTIONARY:
+            # The shared dictionary has a cached index and memoized results
+            return get_valid_words(letters, min_length)
+        return _find_words(self._get_word_index(), letters, min_length)
+
+    def _get_word_index(self) -> List[str]:
+        """Return the sorted index of this instance's words."""
+        words = self.words
+        if not isinstance(words, frozenset):
+            # A mutable set may have changed since the last call
+            return _build_trie(words)
+        # An immutable set is indexed once; holding on to it means the
+        # identity check cannot match a different set at a reused address
+        cached = getattr(self, "_word_index_cache", None)
+        if cached is None or cached[0] is not words:
+            cached = (words, _build_trie(words))
+            self._word_index_cache = cached
+        return cached[1]
@@ -2,9 +2,16 @@
 Generator module for creating test inputs for the qless-solver.
 """
 
+import random
 from typing import List, Optional, Tuple
 
-from qless_solver.dice import create_standard_dice_set
+from qless_solver.dice import QLESS_DICE
+
+__all__ = ["generate_random_roll", "generate_solvable_roll", "generate_test_cases"]
+
+# Faces of each die as a string, indexed by face number
+_DICE_FACES = ["".join(sides) for sides in QLESS_DICE]
+_ROLL_OUTCOMES = 6 ** len(QLESS_DICE)
 
 
 def generate_random_roll() -> str:
@@ -14,9 +21,14 @@ def generate_random_roll() -> str:
     Returns:
         A string of 12 letters representing a random roll of the dice.
     """
-    dice_set = create_standard_dice_set()
-    _, roll_string = dice_set.roll(), dice_set.get_roll_string()
-    return roll_string
+    # One draw over all 6**12 outcomes; its base-6 digits are independent,
+    # uniform face indices, one per die
+    outcome = random.randrange(_ROLL_OUTCOMES)
+    letters = []
+    for faces in _DICE_FACES:
+        outcome, face = divmod(outcome, 6)
+        letters.append(faces[face])
+    return "".join(letters)
 
 
 def generate_solvable_roll(words: Optional[List[str]] = None) -> Tuple[str, List[str]]:
@@ -59,4 +71,24 @@ def generate_test_cases(count: int = 10) -> List[str]:
     Returns:
         A list of strings, each representing a roll of the Q-Less dice.
     """
-    return [generate_random_roll() for _ in range(count)]
+    if count <= 0:
+        return []
+
+    # Imported here so that only batch generation pays for loading numpy
+    import numpy as np
+
+    # ASCII codes of every die face, shaped (dice, sides)
+    dice_codes = np.array(
+        [[ord(letter) for letter in sides] for sides in QLESS_DICE], dtype=np.uint8
+    )
+    dice_count, side_count = dice_codes.shape
+
+    # Seed from the random module so random.seed() keeps the cases
+    # reproducible, then draw every face index in one call and gather the
+    # letters per die
+    rng = np.random.default_rng(random.getrandbits(64))
+    faces = rng.integers(0, side_count, size=(count, dice_count))
+    letters = dice_codes[np.arange(dice_count), faces]
+
+    # Each row of ASCII codes reinterpreted as one fixed-width byte string
+    return letters.view(f"S{dice_count}").ravel().astype(str).tolist()
@@ -1,10 +1,74 @@
 from collections import Counter
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from pydantic import BaseModel, Field
 
 # Ensure this import path is correct based on your project structure
-from qless_solver.dictionary import Dictionary
+from qless_solver.dictionary import (
+    LETTER_MASK_GUARDS,
+    Dictionary,
+    letter_mask,
+    to_valid_words,
+)
+
+# Lightweight forms used inside the backtracker; the Pydantic models below
+# are only built for the solutions it returns
+_Anchor = Tuple[int, int, str]
+_CellChanges = List[Tuple[Tuple[int, int], Optional[str]]]
+
+
+def _word_cells(word: str, position: "GridPosition") -> Dict[Tuple[int, int], str]:
+    # Map each cell the word covers to its letter, for a single dict.update
+    x, y = position.x, position.y
+    if position.direction == "across":
+        return {(x + i, y): char for i, char in enumerate(word)}
+    return {(x, y + i): char for i, char in enumerate(word)}  # down
+
+
+def _write_word(
+    cells: Dict[Tuple[int, int], str], word: str, x: int, y: int, direction: str
+) -> _CellChanges:
+    # Write the word and return each changed cell with its previous letter
+    # (None if the cell was empty) so _restore_cells can reverse it
+    changes: _CellChanges = []
+    for i, char in enumerate(word):
+        cell = (x + i, y) if direction == "across" else (x, y + i)
+        previous = cells.get(cell)
+        if previous != char:
+            changes.append((cell, previous))
+            cells[cell] = char
+    return changes
+
+
+def _restore_cells(cells: Dict[Tuple[int, int], str], changes: _CellChanges) -> None:
+    # Restore overwritten letters in place so the remaining cells keep
+    # their order
+    for cell, previous in reversed(changes):
+        if previous is None:
+            del cells[cell]
+        else:
+            cells[cell] = previous
+
+
+def _anchor_points(cells: Dict[Tuple[int, int], str]) -> List[_Anchor]:
+    # Placeholder: Needs more sophisticated logic
+    if not cells:  # If grid is empty, anchor at origin for the first word
+        return [(0, 0, "across"), (0, 0, "down")]
+
+    # Cells are keyed (x, y): "across" words advance x and "down" words
+    # advance y. A set of plain tuples removes the duplicates cheaply.
+    anchors: Set[_Anchor] = set()
+    for x, y in cells:
+        # Start a word overlaying the existing letter, crossing it
+        anchors.add((x, y, "across"))
+        anchors.add((x, y, "down"))
+        # Start a word next to the letter along its own direction
+        anchors.add((x + 1, y, "across"))  # Right of existing letter
+        anchors.add((x - 1, y, "across"))  # Left of existing letter
+        anchors.add((x, y + 1, "down"))  # Below existing letter
+        anchors.add((x, y - 1, "down"))  # Above existing letter
+
+    return list(anchors)
 
 
 class GridPosition(BaseModel):
@@ -27,12 +91,7 @@ class Grid(BaseModel):
 
     def place_word(self, word: str, position: GridPosition) -> bool:
         # Simulate cell updates based on word and position
-        if position.direction == "across":
-            for i, char in enumerate(word):
-                self.cells[(position.x + i, position.y)] = char
-        else:  # down
-            for i, char in enumerate(word):
-                self.cells[(position.x, position.y + i)] = char
+        self.cells.update(_word_cells(word, position))
         self.words.append(PlacedWord(word=word, position=position))
         return True
 
@@ -45,40 +104,10 @@ class Grid(BaseModel):
         return True
 
     def get_anchor_points(self) -> List[GridPosition]:
-        # Placeholder: Needs more sophisticated logic
-        if not self.cells:  # If grid is empty, anchor at origin for the first word
-            return [
-                GridPosition(x=0, y=0, direction="across"),
-                GridPosition(x=0, y=0, direction="down"),
-            ]
-
-        anchors: Set[GridPosition] = set()  # Use a set to avoid duplicate anchors
-        # A more robust approach would be to find all cells adjacent to existing letters
-        # where a new word could potentially start.
-        for r, c in self.cells.keys():
-            # Try to place words starting one cell away in all 4 directions
-            # For "across" words
-            anchors.add(
-                GridPosition(x=r, y=c + 1, direction="across")
-            )  # Right of existing letter
-            anchors.add(
-                GridPosition(x=r, y=c - 1, direction="across")
-            )  # Left of existing letter (if word extends left)
-            # For "down" words
-            anchors.add(
-                GridPosition(x=r + 1, y=c, direction="down")
-            )  # Below existing letter
-            anchors.add(
-                GridPosition(x=r - 1, y=c, direction="down")
-            )  # Above existing letter (if word extends up)
-
-        # Also, consider starting a word overlaying an existing letter if it forms a valid new word.
-        # This requires checking if the letter at (r,c) can be part of a new word.
-        for r_cell, c_cell in self.cells.keys():
-            anchors.add(GridPosition(x=r_cell, y=c_cell, direction="across"))
-            anchors.add(GridPosition(x=r_cell, y=c_cell, direction="down"))
-
-        return list(anchors)
+        return [
+            GridPosition(x=x, y=y, direction=direction)
+            for x, y, direction in _anchor_points(self.cells)
+        ]
 
     def remove_word(self, word_to_remove: PlacedWord) -> None:
         # Remove word from self.words
@@ -88,12 +117,7 @@ class Grid(BaseModel):
         # This is safer than trying to selectively remove letters, especially with overlaps.
         self.cells.clear()
         for pw in self.words:
-            if pw.position.direction == "across":
-                for i, char in enumerate(pw.word):
-                    self.cells[(pw.position.x + i, pw.position.y)] = char
-            else:  # down
-                for i, char in enumerate(pw.word):
-                    self.cells[(pw.position.x, pw.position.y + i)] = char
+            self.cells.update(_word_cells(pw.word, pw.position))
 
 
 class GridSolution(BaseModel):
@@ -104,17 +128,8 @@ class GridSolution(BaseModel):
 def get_valid_words(
     letters: str, dictionary: Dictionary, min_length: int = 3
 ) -> List[str]:
-    # Placeholder: Extremely inefficient. Replace with Trie/DAWG-based generation.
-    possible_words = set()
-    from itertools import permutations
-
-    letter_list = list(letters.lower())
-    for i in range(min_length, len(letter_list) + 1):
-        for p in permutations(letter_list, i):
-            word = "".join(p)
-            if dictionary.is_valid_word(word):
-                possible_words.add(word)
-    return list(possible_words)
+    # Walk the dictionary's prefix index, spending the available letters
+    return list(dictionary.find_words(letters, min_length))
 
 
 def sort_words_by_potential(words: List[str]) -> List[str]:
@@ -146,74 +161,87 @@ def find_grid_solutions(
 ) -> List[GridSolution]:
     solutions: List[GridSolution] = []
 
-    # Sort words to try, e.g., longer words first as a heuristic
-    sorted_candidate_words = sort_words_by_potential(possible_words)
+    # Annotate each word with its packed letter counts once, up front, so the
+    # fit check and the letter bookkeeping are single integer operations.
+    # to_valid_words orders them the same way as sort_words_by_potential.
+    candidates = to_valid_words(word.lower() for word in possible_words)
+
+    # Letters outside a-z can never be spent by a dictionary word; they only
+    # count towards the letters left over
+    available_mask = letter_mask(
+        "".join(
+            char * min(count, 15)
+            for char, count in original_available_letters.items()
+            if "a" <= char <= "z"
+        )
+    )
+
+    # The search works on a bare cell dict and (word, x, y, direction)
+    # tuples; Grid/PlacedWord/GridPosition models are only built for the
+    # solutions it emits. validate_placement gets a grid view over the
+    # shared cells.
+    cells: Dict[Tuple[int, int], str] = {}
+    placed: List[Tuple[str, int, int, str]] = []
+    grid_view = Grid.model_construct(cells=cells, words=[])
+    used_words_set: Set[str] = set()
 
-    def backtrack(
-        current_grid: Grid,
-        current_remaining_letters: Counter,
-        used_words_set: Set[str],
-    ) -> None:
+    def backtrack(remaining_mask: int, remaining_count: int) -> None:
         # Base case for recursion
-        if sum(current_remaining_letters.values()) < min_word_length:
-            if current_grid.words:  # Ensure at least one word is placed
-                solution_used_letters = (
-                    original_available_letters - current_remaining_letters
-                )
-                # Ensure solutions are deep copies
+        if remaining_count < min_word_length:
+            if placed:  # Ensure at least one word is placed
                 solutions.append(
                     GridSolution(
-                        grid=current_grid.copy(deep=True),
-                        used_letters=solution_used_letters,
+                        grid=Grid(
+                            cells=dict(cells),
+                            words=[
+                                PlacedWord(
+                                    word=word,
+                                    position=GridPosition(
+                                        x=x, y=y, direction=direction
+                                    ),
+                                )
+                                for word, x, y, direction in placed
+                            ],
+                        ),
+                        used_letters=Counter("".join(word for word, *_ in placed)),
                     )
                 )
             return
 
-        anchor_points = current_grid.get_anchor_points()
-        if (
-            not current_grid.words and not anchor_points
-        ):  # Special case for first word on empty grid
-            anchor_points = [
-                GridPosition(x=0, y=0, direction="across"),
-                GridPosition(x=0, y=0, direction="down"),
-            ]
-
-        for point in anchor_points:
-            for word_to_try in sorted_candidate_words:
+        guarded_mask = remaining_mask | LETTER_MASK_GUARDS
+
+        for x, y, direction in _anchor_points(cells):
+            point = GridPosition.model_construct(x=x, y=y, direction=direction)
+            for candidate in candidates:
+                word_to_try = candidate.text
                 if word_to_try in used_words_set:
                     continue
 
-                word_counter = Counter(word_to_try.lower())
-
-                can_form_word = True
-                for char, count in word_counter.items():
-                    if current_remaining_letters[char] < count:
-                        can_form_word = False
-                        break
-                if not can_form_word:
+                # A lane that borrows clears its guard bit, so all guards
+                # surviving the subtraction means the word fits
+                if (
+                    guarded_mask - candidate.mask
+                ) & LETTER_MASK_GUARDS != LETTER_MASK_GUARDS:
                     continue
 
-                potential_next_grid = current_grid.copy(deep=True)
-                # Correctly create PlacedWord instance before passing to place_word
-                # place_word expects word (str) and position (GridPosition)
-                potential_next_grid.place_word(word_to_try, point)
+                # Place the word in the shared cells and take it back out
+                # after exploring, rather than copying the grid per attempt
+                changes = _write_word(cells, word_to_try, x, y, direction)
+                placed.append((word_to_try, x, y, direction))
 
                 # The validate_placement method is a stub and needs full implementation.
-                # It should ideally check the state of potential_next_grid.
-                if potential_next_grid.validate_placement(word_to_try, point):
-
-                    next_remaining_letters = current_remaining_letters.copy()
-                    for char, count in word_counter.items():
-                        next_remaining_letters[char] -= count
-
-                    next_used_words_set = used_words_set.copy()
-                    next_used_words_set.add(word_to_try)
-
+                # It should ideally check the state of grid_view.
+                if grid_view.validate_placement(word_to_try, point):
+                    used_words_set.add(word_to_try)
                     backtrack(
-                        potential_next_grid, next_remaining_letters, next_used_words_set
+                        remaining_mask - candidate.mask,
+                        remaining_count - candidate.length,
                     )
+                    used_words_set.discard(word_to_try)
+
+                placed.pop()
+                _restore_cells(cells, changes)
 
-    initial_grid = Grid()
-    backtrack(initial_grid, original_available_letters.copy(), set())
+    backtrack(available_mask, sum(original_available_letters.values()))
 
     return solutions
@@ -21,13 +21,17 @@ def apply_threshold(image: np.ndarray) -> np.ndarray:
         The thresholded binary image.
     """
     gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    blurred = cv2.GaussianBlur(gray, (5, 5), 0)
-    thresh = cv2.adaptiveThreshold(
-        blurred,
+    # Blur and threshold in place: the grayscale buffer is ours, and both
+    # filters support matching source and destination, so no full-size
+    # intermediates are allocated
+    cv2.GaussianBlur(gray, (5, 5), 0, dst=gray)
+    cv2.adaptiveThreshold(
+        gray,
         255,
         cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
         cv2.THRESH_BINARY,
         5,
         0,
+        dst=gray,
     )
-    return thresh
+    return gray
@@ -3,10 +3,18 @@ Core solving logic for the Q-Less game.
 """
 
 from collections import Counter
-from typing import Dict, Iterator, List, Set
+from itertools import combinations_with_replacement, groupby, product
+from string import ascii_lowercase
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from pydantic import BaseModel, Field
-from qless_solver.dictionary import get_valid_words
+from qless_solver.dictionary import (
+    LETTER_MASK_GUARDS,
+    ValidWord,
+    get_valid_words,
+    letter_mask,
+    to_valid_words,
+)
 
 
 class Solution(BaseModel):
@@ -21,6 +29,23 @@ class Solution(BaseModel):
         """Get an iterator over the solution's words."""
         return iter(self.words)
 
+    @property
+    def fingerprint(self) -> Optional[int]:
+        """
+        The used letter counts packed into a single integer.
+
+        Two solutions use the same letters exactly when their fingerprints
+        are equal (see ``letter_mask``). It is packed from ``used_letters``
+        on every read, so it follows changes to the counts. It is None if a
+        used letter is outside a-z or is used more than 15 times.
+        """
+        try:
+            return letter_mask(
+                "".join(letter * count for letter, count in self.used_letters.items())
+            )
+        except ValueError:
+            return None
+
 
 def solve_qless(
     letters: str,
@@ -61,7 +86,9 @@ def solve_qless(
 
 
 def find_complete_solutions(
-    possible_words: Set[str], available_letters: Counter, min_word_length: int
+    possible_words: Set[str],
+    available_letters: Counter,
+    min_word_length: int,
 ) -> List[Solution]:
     """
     Find solutions that use all available letters.
@@ -74,48 +101,127 @@ def find_complete_solutions(
     Returns:
         List of solutions
     """
-    solutions: List[Solution] = []
+    # Every complete solution uses exactly the original letters
+    used_letters = +available_letters
+
+    # Encode the roll as packed letter counts so that checking and spending
+    # a word is a single integer operation
+    try:
+        available_mask = letter_mask("".join(used_letters.elements()))
+    except ValueError:
+        # Letters outside a-z can never be used up by dictionary words, and
+        # over-full lanes cannot come from a 12-dice roll
+        return []
+
+    word_lists = _find_word_lists(sorted(possible_words), available_mask)
+
+    return [
+        Solution(words=word_list, used_letters=used_letters) for word_list in word_lists
+    ]
+
+
+def _find_word_lists(
+    possible_words: List[str],
+    available_mask: int,
+) -> List[List[str]]:
+    # Find every combination of words that spends exactly available_mask.
+    # Each combination is returned once, its words in candidate order
+    # (longest first, then alphabetical by the move's first anagram).
+    word_lists: List[List[str]] = []
+    candidates = to_valid_words(possible_words)
+
+    # Anagrams spend exactly the same letters, so search over one move per
+    # distinct mask and expand the interchangeable words at the leaves
+    anagrams: Dict[int, List[str]] = {}
+    moves: List[ValidWord] = []
+    for candidate in candidates:
+        if candidate.mask not in anagrams:
+            anagrams[candidate.mask] = []
+            moves.append(candidate)
+        anagrams[candidate.mask].append(candidate.text)
+
+    # Index the moves by the letters they contain. Every complete
+    # solution has to spend the scarcest letter somehow, so each node only
+    # needs to branch on the words that contain it. Letters are ranked once
+    # by how few candidates contain them (minimum remaining values).
+    letter_lanes: List[Tuple[int, List[ValidWord]]] = []
+    for letter in ascii_lowercase:
+        lane_mask = letter_mask(letter) * 15
+        if available_mask & lane_mask:
+            words_with_letter = [move for move in moves if move.mask & lane_mask]
+            letter_lanes.append((lane_mask, words_with_letter))
+    letter_lanes.sort(key=lambda lane: len(lane[1]))
+
+    # Bind the guard bits locally; the closure reads them at every candidate
+    guards = LETTER_MASK_GUARDS
+
+    # Moves are identified by their position in ``moves``. Branching on the
+    # rarest letter can reach one combination in several orders when two of
+    # its words share that letter, so leaves are deduplicated on the sorted
+    # move positions.
+    move_ranks = {move.mask: rank for rank, move in enumerate(moves)}
+    seen_combinations: Set[Tuple[int, ...]] = set()
+
+    def emit(combination: Tuple[int, ...]) -> None:
+        # A move used k times takes k anagrams in non-decreasing order, so
+        # swapping equal-mask words does not produce a second solution
+        choices = [
+            list(
+                combinations_with_replacement(
+                    anagrams[moves[rank].mask], len(list(run))
+                )
+            )
+            for rank, run in groupby(combination)
+        ]
+        for picks in product(*choices):
+            word_lists.append([word for pick in picks for word in pick])
 
-    # Store the original letters counter for reference
-    original_letters = available_letters.copy()
+    # Remaining letter sets already shown to have no complete decomposition.
+    # Different word orders reach the same remaining mask, and whether it
+    # can be finished does not depend on how it was reached.
+    failed_masks: Set[int] = set()
 
     # A recursive helper function to build solutions
     def backtrack(
-        remaining_letters: Counter,
-        current_solution: List[str],
-    ) -> None:
-        # If no letters remain, we have a complete solution
-        if sum(remaining_letters.values()) == 0:
-            # Create a solution with the words and the used letters
-            solution = Solution(
-                words=current_solution.copy(),
-                used_letters=original_letters - remaining_letters,
-            )
-            solutions.append(solution)
-            return
-
-        # Try each possible word
-        for word in possible_words:
-            word_counter = Counter(word)
-
-            # Check if this word can be formed with remaining letters
-            if all(
-                word_counter[letter] <= remaining_letters[letter]
-                for letter in word_counter
-            ):
-                # Use this word
-                current_solution.append(word)
-                # Remove its letters from remaining_letters
-                for letter, count in word_counter.items():
-                    remaining_letters[letter] -= count
-
-                # Recursively try to complete the solution
-                backtrack(remaining_letters, current_solution)
-
-                # Backtrack
-                current_solution.pop()
-                for letter, count in word_counter.items():
-                    remaining_letters[letter] += count
-
-    backtrack(available_letters.copy(), [])
-    return solutions
+        remaining_mask: int,
+        current_solution: List[int],
+    ) -> bool:
+        # If no letters remain, every choice of anagrams is a solution
+        if remaining_mask == 0:
+            combination = tuple(sorted(current_solution))
+            if combination not in seen_combinations:
+                seen_combinations.add(combination)
+                emit(combination)
+            return True
+
+        if remaining_mask in failed_masks:
+            return False
+
+        # Branch only on the moves that spend the rarest remaining letter
+        moves_to_try = next(
+            moves for lane_mask, moves in letter_lanes if remaining_mask & lane_mask
+        )
+        guarded_mask = remaining_mask | guards
+        found = False
+
+        # Try each possible move
+        for move in moves_to_try:
+            # A lane that borrows clears its guard bit, so all guards
+            # surviving the subtraction means the word fits
+            if (guarded_mask - move.mask) & guards != guards:
+                continue
+
+            # Use this move and recursively try to complete the solution
+            current_solution.append(move_ranks[move.mask])
+            if backtrack(remaining_mask - move.mask, current_solution):
+                found = True
+
+            # Backtrack
+            current_solution.pop()
+
+        if not found:
+            failed_masks.add(remaining_mask)
+        return found
+
+    backtrack(available_mask, [])
+    return word_lists
@@ -9,38 +9,56 @@ from pathlib import Path
 
 import cv2
 
-# Ensure the project root is on the path when running directly from the repo
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
-from cli.qless_solver.preprocess import apply_threshold
-
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Generate thresholded image")
-    parser.add_argument(
+    input_group = parser.add_mutually_exclusive_group(required=True)
+    input_group.add_argument(
         "--input",
-        required=True,
         type=Path,
         help="Path to the source image",
     )
+    input_group.add_argument(
+        "--inputs",
+        nargs="+",
+        type=Path,
+        help="Paths to several source images, processed in one run",
+    )
     parser.add_argument(
         "--output",
         required=True,
         type=Path,
-        help="Path to save the processed image",
+        help=(
+            "Path to save the processed image, or with --inputs a directory "
+            "to save each one as <input stem>.png"
+        ),
     )
     return parser.parse_args()
 
 
 def main() -> None:
+    # Imported here so the path setup below only happens when run as a script
+    from cli.qless_solver.preprocess import apply_threshold
+
     args = parse_args()
-    image = cv2.imread(str(args.input))
-    if image is None:
-        raise FileNotFoundError(f"Unable to load image: {args.input}")
+    if args.inputs:
+        args.output.mkdir(parents=True, exist_ok=True)
+        jobs = [(path, args.output / f"{path.stem}.png") for path in args.inputs]
+    else:
+        jobs = [(args.input, args.output)]
+
+    for input_path, output_path in jobs:
+        # Decode in colour: apply_threshold's BGR-to-gray conversion does not
+        # match a grayscale decode bit for bit, and golden files must
+        image = cv2.imread(str(input_path))
+        if image is None:
+            raise FileNotFoundError(f"Unable to load image: {input_path}")
 
-    result = apply_threshold(image)
-    cv2.imwrite(str(args.output), result)
+        result = apply_threshold(image)
+        cv2.imwrite(str(output_path), result)
 
 
 if __name__ == "__main__":
+    # Ensure the project root is on the path when running directly from the repo
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
     main()
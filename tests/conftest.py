@@ -1,7 +1,77 @@
 import os
 import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Set
+
+import pytest
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
 
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 cli_path = os.path.join(project_root, "cli")
 if cli_path not in sys.path:
     sys.path.insert(0, cli_path)
+# The web app is imported as web.main from the project root
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from qless_solver import dictionary  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """Keep the parsed-dictionary cache out of the user's cache directory.
+
+    Session scoped so it is in place before the dictionary is first loaded.
+    XDG_CACHE_HOME covers the CLI subprocesses as well.
+    """
+    cache_dir = tmp_path_factory.mktemp("cache")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(dictionary, "user_cache_dir", lambda *args, **kwargs: str(cache_dir))
+        mp.setenv("XDG_CACHE_HOME", str(cache_dir))
+        yield cache_dir
+
+
+@pytest.fixture(scope="session")
+def loaded_dictionary() -> Set[str]:
+    """The default dictionary, loaded once per test session."""
+    return dictionary.load_dictionary()
+
+
+# Words the tests rely on, whether or not dictionary.txt has them
+TEST_WORDS = frozenset({"eat", "tea", "ate", "cat", "at", "hat", "dog", "bat"})
+
+
+@pytest.fixture
+def dict_with_testwords(
+    loaded_dictionary: Set[str], monkeypatch: pytest.MonkeyPatch
+) -> Iterator[Set[str]]:
+    """Install a private copy of the dictionary extended with TEST_WORDS.
+
+    The copy is swapped out again after the test, so tests may also add
+    their own words without affecting later tests.
+    """
+    words = loaded_dictionary | TEST_WORDS
+    monkeypatch.setattr(dictionary, "_DICTIONARY", words)
+    monkeypatch.setattr(dictionary, "_WORD_INDEX", None)
+    # A fresh generation keeps memoized lookups for the copy apart from
+    # those for the real dictionary
+    monkeypatch.setattr(
+        dictionary, "_DICTIONARY_GENERATION", next(dictionary._GENERATIONS)
+    )
+    yield words
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator["TestClient"]:
+    """A TestClient for the web app, started once per test session."""
+    # Import here so a broken app only skips the tests that need it, and
+    # the unit tests can be collected without fastapi installed
+    try:
+        from fastapi.testclient import TestClient
+        from web.main import app
+    except Exception as e:
+        pytest.skip(f"FastAPI app not available for testing: {e}")
+    with TestClient(app) as c:
+        yield c
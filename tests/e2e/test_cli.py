@@ -2,110 +2,89 @@
 End-to-end tests for the CLI interface.
 """
 
-import subprocess
+import runpy
 import sys
 
 import pytest
+from qless_solver.cli import main
 
 
-def test_cli_version() -> None:
+def test_cli_version(capsys: pytest.CaptureFixture[str]) -> None:
     """Test that the CLI returns a version number."""
-    # Skip this test if we're not running in development mode
-    pytest.importorskip("qless_solver")
-
-    # Run the CLI with --version
-    result = subprocess.run(
-        [sys.executable, "-m", "qless_solver.cli", "--version"],
-        capture_output=True,
-        text=True,
-    )
+    # argparse exits after printing the version
+    with pytest.raises(SystemExit) as exc:
+        main(["--version"])
 
     # Check that it returned successfully
-    assert result.returncode == 0
+    assert exc.value.code == 0
     # Check that it printed something that looks like a version
-    assert "qless-solver" in result.stdout
+    assert "qless-solver" in capsys.readouterr().out
 
 
-def test_cli_help() -> None:
+def test_cli_help(capsys: pytest.CaptureFixture[str]) -> None:
     """Test that the CLI help works."""
-    # Skip this test if we're not running in development mode
-    pytest.importorskip("qless_solver")
-
-    # Run the CLI with --help
-    result = subprocess.run(
-        [sys.executable, "-m", "qless_solver.cli", "--help"],
-        capture_output=True,
-        text=True,
-    )
+    with pytest.raises(SystemExit) as exc:
+        main(["--help"])
 
     # Check that it returned successfully
-    assert result.returncode == 0
+    assert exc.value.code == 0
     # Check that it printed help information
-    assert "usage:" in result.stdout.lower()
-    assert "--letters" in result.stdout
+    output = capsys.readouterr().out
+    assert "usage:" in output.lower()
+    assert "--letters" in output
 
 
-def test_cli_with_letters() -> None:
+@pytest.mark.usefixtures("dict_with_testwords")
+def test_cli_with_letters(capsys: pytest.CaptureFixture[str]) -> None:
     """Test the CLI with a simple letter input."""
-    # Skip this test if we're not running in development mode
-    pytest.importorskip("qless_solver")
-
-    # First, add some test words to the dictionary
-    # This is a bit of a hack, but it works for testing
-    from qless_solver.dictionary import add_custom_words
-
-    add_custom_words({"eat", "tea", "ate"})
-
     # Run the CLI with a simple input that should match our test words
     # Make sure we have exactly 12 letters
-    result = subprocess.run(
-        [
-            sys.executable,
-            "-m",
-            "qless_solver.cli",
-            "--letters",
-            "eatbcdfghijk",
-            "--all-words",
-        ],
-        capture_output=True,
-        text=True,
-    )
+    result = main(["--letters", "eatbcdfghijk", "--all-words"])
 
     # Check that it returned successfully
-    assert result.returncode == 0
+    assert result == 0
 
     # Check that it found the expected words
-    assert "eat" in result.stdout
-    assert "tea" in result.stdout
-    assert "ate" in result.stdout
+    output = capsys.readouterr().out
+    assert "eat" in output
+    assert "tea" in output
+    assert "ate" in output
+
+
+@pytest.mark.parametrize(
+    "letters,expected",
+    [
+        # Too few letters
+        ("abc", "Expected exactly 12 letters"),
+        # Non-letter characters
+        ("abc123defghi", "Input must contain only letters"),
+    ],
+)
+def test_cli_invalid_input(
+    capsys: pytest.CaptureFixture[str], letters: str, expected: str
+) -> None:
+    """Test the CLI with invalid input."""
+    result = main(["--letters", letters])
 
+    # Check that it returned an error before solving
+    assert result != 0
+    assert expected in capsys.readouterr().err
 
-def test_cli_invalid_input() -> None:
-    """Test the CLI with invalid input."""
-    # Skip this test if we're not running in development mode
-    pytest.importorskip("qless_solver")
-
-    # Run the CLI with too few letters
-    result = subprocess.run(
-        [sys.executable, "-m", "qless_solver.cli", "--letters", "abc"],
-        capture_output=True,
-        text=True,
-    )
-
-    # Check that it returned an error
-    assert result.returncode != 0
-    assert "Expected exactly 12 letters" in result.stderr
-
-    # Run the CLI with non-letter characters
-    result = subprocess.run(
-        [sys.executable, "-m", "qless_solver.cli", "--letters", "abc123defghi"],
-        capture_output=True,
-        text=True,
-    )
-
-    # Check that it returned an error
-    assert result.returncode != 0
-    assert "Input must contain only letters" in result.stderr
+
+# The module is already imported by the tests above, which runpy warns about
+@pytest.mark.filterwarnings("ignore:.*found in sys.modules:RuntimeWarning")
+def test_cli_module_entry_point(
+    capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that ``python -m qless_solver.cli`` is wired to main."""
+    monkeypatch.setattr(sys, "argv", ["qless-solver", "--version"])
+
+    # Run the module as __main__ in-process, as ``python -m`` would
+    with pytest.raises(SystemExit) as exc:
+        runpy.run_module("qless_solver.cli", run_name="__main__")
+
+    assert exc.value.code == 0
+    assert "qless-solver" in capsys.readouterr().out
 
 
 if __name__ == "__main__":
@@ -1,19 +1,8 @@
-import os
-import sys
+import re
 
 import pytest
 from fastapi.testclient import TestClient
 
-# Ensure the web app can be imported
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
-
-try:
-    from web.main import app
-except Exception:
-    app = None
-
 GRID_CASES = {
     "test_grid_1.jpg": [
         ".f...",
@@ -48,13 +37,8 @@ GRID_CASES = {
     ],
 }
 
-
-@pytest.fixture(scope="module")
-def client():
-    if app is None:
-        pytest.skip("FastAPI app not available for testing.")
-    with TestClient(app) as c:
-        yield c
+# Matches any row of the first default grid, so one pass finds them all
+GRID_1_ROWS = re.compile("|".join(map(re.escape, GRID_CASES["test_grid_1.jpg"])))
 
 
 @pytest.mark.xfail(reason="Default grid not shown on page load yet")
@@ -63,8 +47,7 @@ def test_index_displays_default_grid(client: TestClient):
     assert response.status_code == 200
     html = response.text
     assert "solution-grid" in html
-    for row in GRID_CASES["test_grid_1.jpg"]:
-        assert row in html
+    assert set(GRID_1_ROWS.findall(html)) == set(GRID_CASES["test_grid_1.jpg"])
 
 
 @pytest.mark.xfail(reason="Navigation arrows not implemented yet")
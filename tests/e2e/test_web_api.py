@@ -1,35 +1,57 @@
-import os
-import sys
 from collections import Counter  # Import Counter for mock solution
+from io import BytesIO
+from typing import Iterator
 
+import cv2
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
+from qless_solver.grid_solver import Grid, GridPosition, GridSolution, PlacedWord
 
-# Add project root to sys.path to allow importing web.main
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
 
-# Import the app from web.main
-# This might fail if web.main has issues at import time (e.g. dictionary not found)
-try:
-    from web.main import app
-except ImportError as e:
-    print(f"Skipping web API tests: Could not import FastAPI app from web.main: {e}")
-    # Define a placeholder app or skip tests if app import fails
-    app = None
-except Exception as e:
-    print(f"An unexpected error occurred during app import for tests: {e}")
-    app = None
+def make_mock_solution(word: str) -> GridSolution:
+    """A one-word solution placed across from the origin."""
+    return GridSolution(
+        grid=Grid(
+            words=[
+                PlacedWord(
+                    word=word, position=GridPosition(x=0, y=0, direction="across")
+                )
+            ],
+            cells={(0, 0): word[0]},
+        ),
+        used_letters=Counter(word),
+    )
+
+
+# Built once and shared by the mocked solvers below
+MOCK_SOLUTION_TEST = make_mock_solution("test")
+MOCK_SOLUTION_HTMX = make_mock_solution("htmx")
+MOCK_SOLUTION_IMG = make_mock_solution("img")
+
+# Expected HTML fragments, encoded once and matched against the raw body
+HTMX_FOUND_NEEDLE = b"Found 1 solution(s) for letters: <strong>htmx</strong>"
+HTMX_NONE_NEEDLE = b"No solutions found for letters: <strong>none</strong>"
 
 
 @pytest.fixture(scope="module")
-def client():
-    if app is None:
-        pytest.skip("FastAPI app not available for testing.")
-    # Create a TestClient instance using the FastAPI app
-    with TestClient(app) as c:
-        yield c
+def png_image_bytes() -> bytes:
+    """A real 1x1 PNG, encoded once for the upload tests."""
+    ok, encoded = cv2.imencode(".png", np.zeros((1, 1, 3), np.uint8))
+    assert ok
+    return encoded.tobytes()
+
+
+@pytest.fixture(autouse=True)
+def clear_response_caches(client: TestClient) -> Iterator[None]:
+    """Keep responses cached from one test's mocked solver out of the next."""
+    from web.main import _render_solutions, _solve_json
+
+    _render_solutions.cache_clear()
+    _solve_json.cache_clear()
+    yield
+    _render_solutions.cache_clear()
+    _solve_json.cache_clear()
 
 
 def test_read_root_html(client: TestClient):
@@ -41,29 +63,9 @@ def test_read_root_html(client: TestClient):
 
 # Test for the JSON API endpoint
 def test_solve_letters_api_json(client: TestClient, monkeypatch):
-    # Import models needed for mocking the response
-    from qless_solver.grid_solver import (
-        Grid,
-        GridPosition,
-        GridSolution,
-        PlacedWord,
-    )
-
-    mock_solution = GridSolution(
-        grid=Grid(
-            words=[
-                PlacedWord(
-                    word="test", position=GridPosition(x=0, y=0, direction="across")
-                )
-            ],
-            cells={(0, 0): "t"},
-        ),
-        used_letters=Counter("test"),
-    )
-
     def mock_solve_qless_grid_func(letters: str, min_word_length: int):
         if letters == "test":
-            return [mock_solution]
+            return [MOCK_SOLUTION_TEST]
         return []
 
     # Patch the function in the module where it's defined and used by the endpoint
@@ -86,30 +88,30 @@ def test_solve_letters_api_json(client: TestClient, monkeypatch):
     assert len(response_no_solution.json()) == 0
 
 
-# Test for the HTMX form submission endpoint
-def test_solve_letters_htmx(client: TestClient, monkeypatch):
-    from qless_solver.grid_solver import (
-        Grid,
-        GridPosition,
-        GridSolution,
-        PlacedWord,
-    )
+def test_solve_letters_api_caches_responses(client: TestClient, monkeypatch):
+    calls = []
 
-    mock_solution = GridSolution(
-        grid=Grid(
-            words=[
-                PlacedWord(
-                    word="htmx", position=GridPosition(x=0, y=0, direction="across")
-                )
-            ],
-            cells={(0, 0): "h"},
-        ),
-        used_letters=Counter("htmx"),
-    )
+    def mock_solve_qless_grid_func(letters: str, min_word_length: int):
+        calls.append((letters, min_word_length))
+        return [MOCK_SOLUTION_TEST]
+
+    monkeypatch.setattr("web.main.solve_qless_grid", mock_solve_qless_grid_func)
 
+    first = client.post("/api/solve/", json={"letters": "test", "min_word_length": 3})
+    second = client.post("/api/solve/", json={"letters": "test", "min_word_length": 3})
+    assert second.content == first.content
+    assert calls == [("test", 3)]
+
+    # A different minimum word length is solved separately
+    client.post("/api/solve/", json={"letters": "test", "min_word_length": 4})
+    assert calls == [("test", 3), ("test", 4)]
+
+
+# Test for the HTMX form submission endpoint
+def test_solve_letters_htmx(client: TestClient, monkeypatch):
     def mock_solve_qless_grid_for_htmx(letters: str, min_word_length: int):
         if letters == "htmx":
-            return [mock_solution]
+            return [MOCK_SOLUTION_HTMX]
         return []
 
     monkeypatch.setattr("web.main.solve_qless_grid", mock_solve_qless_grid_for_htmx)
@@ -119,99 +121,82 @@ def test_solve_letters_htmx(client: TestClient, monkeypatch):
     )
     assert response.status_code == 200
     assert response.headers["content-type"] == "text/html; charset=utf-8"
-    assert "Found 1 solution(s) for letters: <strong>htmx</strong>" in response.text
-    assert "htmx" in response.text
+    assert HTMX_FOUND_NEEDLE in response.content
+    assert b"htmx" in response.content
 
     response_no_solution = client.post(
         "/solve-htmx/", data={"letters": "none", "min_word_length": "4"}
     )
     assert response_no_solution.status_code == 200
-    assert (
-        "No solutions found for letters: <strong>none</strong>"
-        in response_no_solution.text
-    )
-
-
-def test_solve_api_error_handling(client: TestClient, monkeypatch):
-    def mock_solver_raises_exception(letters: str, min_word_length: int):
-        raise ValueError("Solver internal error")
-
-    monkeypatch.setattr("web.main.solve_qless_grid", mock_solver_raises_exception)
-    response = client.post(
-        "/api/solve/", json={"letters": "error", "min_word_length": 3}
-    )
-    assert response.status_code == 500
-    assert "Solver internal error" in response.json()["detail"]
-
-
-def test_solve_api_dictionary_not_found(client: TestClient, monkeypatch):
-    def mock_solver_raises_file_not_found(letters: str, min_word_length: int):
-        raise FileNotFoundError("dictionary.txt not found at expected_path")
-
-    monkeypatch.setattr("web.main.solve_qless_grid", mock_solver_raises_file_not_found)
-    response = client.post(
-        "/api/solve/", json={"letters": "dict_error", "min_word_length": 3}
-    )
-    assert response.status_code == 500
-    # Check if the detail message contains the specific parts we expect
-    detail = response.json()["detail"]
-    assert "Dictionary file not found" in detail
-    assert "dictionary.txt not found at expected_path" in detail
-
-
-# Similar error handling test for HTMX endpoint
-def test_solve_htmx_error_handling(client: TestClient, monkeypatch):
-    def mock_solver_raises_exception_htmx(letters: str, min_word_length: int):
-        raise ValueError("HTMX Solver internal error")
-
-    monkeypatch.setattr("web.main.solve_qless_grid", mock_solver_raises_exception_htmx)
-    response = client.post(
-        "/solve-htmx/", data={"letters": "error_htmx", "min_word_length": "3"}
-    )
-    assert response.status_code == 200  # HTMX endpoint returns HTML with error message
-    assert (
-        "<strong>Error:</strong> An error occurred during solving: HTMX Solver internal error"
-        in response.text
-    )
-
-
-def test_solve_image_endpoint(client: TestClient, monkeypatch):
-    from io import BytesIO
-
-    from qless_solver.grid_solver import (
-        Grid,
-        GridPosition,
-        GridSolution,
-        PlacedWord,
-    )
-
-    mock_solution = GridSolution(
-        grid=Grid(
-            words=[
-                PlacedWord(
-                    word="img", position=GridPosition(x=0, y=0, direction="across")
-                )
-            ],
-            cells={(0, 0): "i"},
-        ),
-        used_letters=Counter("img"),
-    )
-
-    def mock_detect_letters(_: bytes) -> str:
+    assert HTMX_NONE_NEEDLE in response_no_solution.content
+
+
+SOLVER_ERROR_CASES = [
+    # The JSON API reports solver failures as a 500 with the error detail
+    (
+        "/api/solve/",
+        {"json": {"letters": "error", "min_word_length": 3}},
+        ValueError("Solver internal error"),
+        500,
+        [b"Solver internal error"],
+    ),
+    (
+        "/api/solve/",
+        {"json": {"letters": "dict_error", "min_word_length": 3}},
+        FileNotFoundError("dictionary.txt not found at expected_path"),
+        500,
+        [b"Dictionary file not found", b"dictionary.txt not found at expected_path"],
+    ),
+    # The HTMX endpoint returns HTML with the error message instead
+    (
+        "/solve-htmx/",
+        {"data": {"letters": "error_htmx", "min_word_length": "3"}},
+        ValueError("HTMX Solver internal error"),
+        200,
+        [
+            b"<strong>Error:</strong> An error occurred during solving: "
+            b"HTMX Solver internal error"
+        ],
+    ),
+]
+
+
+@pytest.mark.parametrize("path,request_kwargs,error,status,needles", SOLVER_ERROR_CASES)
+def test_solve_error_handling(
+    client: TestClient,
+    monkeypatch,
+    path: str,
+    request_kwargs: dict,
+    error: Exception,
+    status: int,
+    needles: list,
+):
+    def mock_solver_raises(letters: str, min_word_length: int):
+        raise error
+
+    monkeypatch.setattr("web.main.solve_qless_grid", mock_solver_raises)
+    response = client.post(path, **request_kwargs)
+    assert response.status_code == status
+    for needle in needles:
+        assert needle in response.content
+
+
+def test_solve_image_endpoint(client: TestClient, monkeypatch, png_image_bytes: bytes):
+    def mock_detect_letters(image_bytes: bytes) -> str:
+        assert image_bytes == png_image_bytes
         return "img"
 
     def mock_solve_qless_grid_func(letters: str, min_word_length: int):
         if letters == "img":
-            return [mock_solution]
+            return [MOCK_SOLUTION_IMG]
         return []
 
     monkeypatch.setattr("web.main.detect_letters", mock_detect_letters)
     monkeypatch.setattr("web.main.solve_qless_grid", mock_solve_qless_grid_func)
 
-    fake_file = BytesIO(b"fake")
     response = client.post(
         "/solve-image/",
-        files={"image": ("test.png", fake_file, "image/png")},
+        files={"image": ("test.png", BytesIO(png_image_bytes), "image/png")},
         data={"min_word_length": "3"},
     )
     assert response.status_code == 200
@@ -2,8 +2,9 @@
 Unit tests for the qless_solver.dice module.
 """
 
+import random
+
 import pytest
-from pydantic import ValidationError
 from qless_solver.dice import (
     QLESS_DICE,
     DiceSet,
@@ -13,6 +14,12 @@ from qless_solver.dice import (
 )
 
 
+@pytest.fixture(scope="module")
+def standard_dice_set() -> DiceSet:
+    """A standard dice set for tests that only read the dice."""
+    return create_standard_dice_set()
+
+
 def test_die_init() -> None:
     """Test die initialization."""
     # Test with valid sides
@@ -21,10 +28,10 @@ def test_die_init() -> None:
     assert die.current_face is None
 
     # Test with invalid number of sides
-    with pytest.raises(ValidationError):
+    with pytest.raises(ValueError):
         Die(sides=["A", "B", "C", "D", "E"], current_face=None)
 
-    with pytest.raises(ValidationError):
+    with pytest.raises(ValueError):
         Die(sides=["A", "B", "C", "D", "E", "F", "G"], current_face=None)
 
 
@@ -39,11 +46,11 @@ def test_die_roll() -> None:
     assert die.roll(use_face_index=5) == "F"
     assert die.current_face == "F"
 
-    # Test random roll is one of the sides
-    for _ in range(10):  # Roll multiple times to ensure randomness works
-        letter = die.roll()
-        assert letter in ["A", "B", "C", "D", "E", "F"]
-        assert die.current_face == letter
+    # Test seeded random rolls land on a side and are reproducible
+    letters = [die.roll(rng=random.Random(1234)) for _ in range(2)]
+    assert letters[0] == letters[1]
+    assert letters[0] in ["A", "B", "C", "D", "E", "F"]
+    assert die.current_face == letters[1]
 
 
 def test_dice_set_init() -> None:
@@ -78,6 +85,12 @@ def test_dice_set_roll() -> None:
     assert len(result) == 2
     assert all(letter in "ABCDEFGHIJKL" for letter in result)
 
+    # Random rolls follow the module-level seed
+    random.seed(1234)
+    first = list(dice_set.roll())
+    random.seed(1234)
+    assert dice_set.roll() == first
+
 
 def test_get_letter_frequency() -> None:
     """Test getting letter frequencies from a roll."""
@@ -94,9 +107,9 @@ def test_get_letter_frequency() -> None:
     assert freq == {"B": 1, "D": 1}
 
 
-def test_create_standard_dice_set() -> None:
+def test_create_standard_dice_set(standard_dice_set: DiceSet) -> None:
     """Test creating a standard dice set."""
-    dice_set = create_standard_dice_set()
+    dice_set = standard_dice_set
     assert len(dice_set.dice) == 12
 
     # Check that the dice match the standard configuration
@@ -138,7 +151,7 @@ def test_qless_dice_distribution() -> None:
     assert QLESS_DICE[11] == ["A", "A", "E", "E", "O", "O"]  # Die 12 (vowels)
 
     # Verify that all letters from A to Z except Q are present
-    all_letters = [letter for die in QLESS_DICE for letter in die]
+    all_letters = {letter for die in QLESS_DICE for letter in die}
     for letter in "ABCDEFGHIJKLMNOPRSTUVWXYZ":  # Excluding Q
         assert letter in all_letters
 
@@ -2,26 +2,47 @@
 Unit tests for the qless_solver.dictionary module.
 """
 
+import os
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Set
 
 import pytest
+from qless_solver import dictionary as dictionary_module
 from qless_solver.dictionary import (
+    Dictionary,
     add_custom_words,
     can_form_word,
     get_valid_words,
     is_valid_word,
+    letter_mask,
     load_dictionary,
+    mask_contains,
+    to_valid_words,
 )
 
 
-def test_load_dictionary() -> None:
+def test_load_dictionary(loaded_dictionary: Set[str]) -> None:
     """Test that the dictionary loads correctly."""
-    dictionary = load_dictionary()
+    dictionary = loaded_dictionary
     assert isinstance(dictionary, set)
     assert len(dictionary) > 0
     assert all(isinstance(word, str) for word in dictionary)
 
 
+def test_load_dictionary_concurrent_first_access(monkeypatch) -> None:
+    """Test that concurrent first calls all share a single loaded dictionary."""
+    monkeypatch.setattr("qless_solver.dictionary._DICTIONARY", None)
+    monkeypatch.setattr("qless_solver.dictionary._WORD_INDEX", None)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: load_dictionary(), range(8)))
+
+    assert all(result is results[0] for result in results)
+
+
+@pytest.mark.usefixtures("dict_with_testwords")
 def test_is_valid_word() -> None:
     """Test the is_valid_word function."""
     # Test with a word that should be in the dictionary
@@ -53,11 +74,32 @@ def test_can_form_word() -> None:
     assert can_form_word("EaT", Counter("eatxyz")) is True
 
 
+def test_letter_mask() -> None:
+    """Test packed letter-count masks and containment checks."""
+    available = letter_mask("eatxyz")
+
+    assert mask_contains(available, letter_mask("eat")) is True
+    assert mask_contains(available, letter_mask("EaT")) is True
+    assert mask_contains(available, letter_mask("tee")) is False
+    assert mask_contains(available, letter_mask("eats")) is False
+    assert available - letter_mask("eat") == letter_mask("xyz")
+
+    with pytest.raises(ValueError):
+        letter_mask("ab1")
+
+
+def test_to_valid_words() -> None:
+    """Test that candidate words are annotated and ordered longest first."""
+    valid_words = to_valid_words({"cat", "at", "hat", "chat"})
+
+    assert [word.text for word in valid_words] == ["chat", "cat", "hat", "at"]
+    assert valid_words[0].length == 4
+    assert valid_words[0].mask == letter_mask("chat")
+
+
+@pytest.mark.usefixtures("dict_with_testwords")
 def test_get_valid_words() -> None:
     """Test the get_valid_words function."""
-    # Add test words to the dictionary
-    add_custom_words({"cat", "at", "hat"})
-
     # Test with letters that can form "cat" and "hat"
     valid_words = get_valid_words("cathat", min_length=3)
     assert "cat" in valid_words
@@ -69,6 +111,53 @@ def test_get_valid_words() -> None:
     assert "at" in valid_words
 
 
+@pytest.mark.usefixtures("dict_with_testwords")
+def test_get_valid_words_after_add_custom_words() -> None:
+    """Test that memoized results pick up words added later."""
+    assert "zzxq" not in get_valid_words("qxzz", min_length=3)
+
+    add_custom_words({"zzxq"})
+
+    # Same letter multiset in a different order hits the same cache entry
+    assert "zzxq" in get_valid_words("qxzz", min_length=3)
+    assert "zzxq" in get_valid_words("zqzx", min_length=3)
+
+
+@pytest.mark.usefixtures("dict_with_testwords")
+def test_get_valid_words_lookup_racing_add_custom_words(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a lookup overtaken by add_custom_words is not served later."""
+    find_words = dictionary_module._find_words
+
+    def find_words_then_add(word_index: List[str], letters: str, min_length: int):
+        # The lookup already holds the old index when the word is added
+        monkeypatch.setattr(dictionary_module, "_find_words", find_words)
+        add_custom_words({"zzxq"})
+        return find_words(word_index, letters, min_length)
+
+    monkeypatch.setattr(dictionary_module, "_find_words", find_words_then_add)
+
+    assert "zzxq" not in get_valid_words("qxzz", min_length=3)
+    assert "zzxq" in get_valid_words("qxzz", min_length=3)
+
+
+@pytest.mark.usefixtures("dict_with_testwords")
+def test_add_custom_words_concurrent_with_lookups() -> None:
+    """Test that words added while other threads enumerate are all indexed."""
+    added = [f"zq{letter}" for letter in "abcdefgh"]
+
+    def add_then_look_up(word: str) -> None:
+        add_custom_words({word})
+        get_valid_words("zqabcdefgh", min_length=3)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(add_then_look_up, added))
+
+    assert set(added) <= get_valid_words("zqabcdefgh", min_length=3)
+
+
+@pytest.mark.usefixtures("dict_with_testwords")
 def test_add_custom_words() -> None:
     """Test the add_custom_words function."""
     # Add custom words
@@ -80,5 +169,85 @@ def test_add_custom_words() -> None:
     assert "anotherword" in dictionary
 
 
+def test_dictionary_find_words_own_words() -> None:
+    """Test that a Dictionary with its own words finds them after edits."""
+    dictionary = Dictionary()
+    dictionary.words = {"cat", "at", "dog"}
+    assert dictionary.find_words("tac", min_length=2) == {"cat", "at"}
+
+    # A same-size edit to a mutable set is picked up
+    dictionary.words.discard("dog")
+    dictionary.words.add("act")
+    assert dictionary.find_words("tac", min_length=2) == {"cat", "act", "at"}
+
+
+def test_dictionary_find_words_indexes_frozenset_once() -> None:
+    """Test that an immutable word set is indexed only once."""
+    dictionary = Dictionary()
+    dictionary.words = frozenset({"cat", "act", "at"})
+
+    index = dictionary._get_word_index()
+    assert dictionary._get_word_index() is index
+    assert dictionary.find_words("tac", min_length=2) == {"cat", "act", "at"}
+
+    dictionary.words = frozenset({"cat"})
+    assert dictionary.find_words("tac", min_length=2) == {"cat"}
+
+
+@pytest.fixture
+def dictionary_file(tmp_path: Path) -> Path:
+    """A small dictionary file with a fresh cache of its parsed words."""
+    path = tmp_path / "words.txt"
+    path.write_text("CAT a small animal\nDOG\n", encoding="utf-8")
+    dictionary_module._write_cache(path, ["cat", "dog"])
+    # Make the cache strictly newer than the file it was parsed from
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+    return path
+
+
+def test_cache_round_trip(dictionary_file: Path) -> None:
+    """Test that a fresh cache returns the words written to it."""
+    assert dictionary_module._read_cache(dictionary_file) == ["cat", "dog"]
+
+
+def test_cache_ignored_when_stale(dictionary_file: Path) -> None:
+    """Test that a dictionary file edited after caching is parsed again."""
+    cache_mtime = dictionary_module._cache_path(dictionary_file).stat().st_mtime_ns
+    os.utime(dictionary_file, ns=(cache_mtime + 10**9, cache_mtime + 10**9))
+
+    assert dictionary_module._read_cache(dictionary_file) is None
+
+
+@pytest.mark.parametrize("contents", [b"", b"\x80\x05\x95", b"not a pickle"])
+def test_cache_ignored_when_corrupt(dictionary_file: Path, contents: bytes) -> None:
+    """Test that an empty, truncated or garbled cache file is ignored."""
+    cache_path = dictionary_module._cache_path(dictionary_file)
+    stat = cache_path.stat()
+    cache_path.write_bytes(contents)
+    os.utime(cache_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert dictionary_module._read_cache(dictionary_file) is None
+
+
+def test_cache_ignored_after_version_bump(
+    dictionary_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that caches written by another cache version are not read."""
+    monkeypatch.setattr(
+        dictionary_module, "_CACHE_VERSION", dictionary_module._CACHE_VERSION + 1
+    )
+
+    assert dictionary_module._read_cache(dictionary_file) is None
+
+
+def test_cache_written_to_isolated_dir(
+    dictionary_file: Path, isolated_cache_dir: Path
+) -> None:
+    """Test that the suite keeps its caches out of the user cache directory."""
+    cache_path = dictionary_module._cache_path(dictionary_file)
+    assert cache_path.parent == isolated_cache_dir
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -14,10 +14,10 @@ from qless_solver.grid_solver import (
 # Mock Dictionary for testing get_valid_words and solve_qless_grid
 class MockDictionary(Dictionary):
     def __init__(self, words=None):
-        self._words = set(words) if words else set()
+        self.words = set(words) if words else set()
 
     def is_valid_word(self, word: str) -> bool:
-        return word in self._words
+        return word in self.words
 
     def load_dictionary(self, filepath: str) -> None:  # Add filepath argument
         pass  # Don't load from file for mock
@@ -96,6 +96,10 @@ def test_get_anchor_points_with_word(empty_grid: Grid):
     anchors = grid.get_anchor_points()
     # The current get_anchor_points is a placeholder, so this test is basic.
     assert len(anchors) > 0
+    # Across anchors run along x, beside and over the placed letters
+    assert GridPosition(x=3, y=0, direction="across") in anchors
+    assert GridPosition(x=1, y=0, direction="down") in anchors
+    assert GridPosition(x=0, y=1, direction="across") not in anchors
 
 
 def test_validate_placement_stub(empty_grid: Grid):
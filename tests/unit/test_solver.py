@@ -5,7 +5,7 @@ Unit tests for the qless_solver.solver module.
 from collections import Counter
 
 import pytest
-from qless_solver.dictionary import add_custom_words
+from qless_solver.dictionary import letter_mask
 from qless_solver.solver import Solution, find_complete_solutions, solve_qless
 
 
@@ -24,12 +24,20 @@ def test_solution_model() -> None:
     words = list(solution.get_words())
     assert words == ["hello", "world"]
 
+    # The fingerprint packs the used letter counts
+    assert solution.fingerprint == letter_mask("helloworld")
 
+    # The fingerprint follows changes to the counts
+    solution.used_letters["l"] = 2
+    assert solution.fingerprint == letter_mask("heloworld")
+
+    # Letters the mask cannot encode leave the solution without a fingerprint
+    assert Solution(words=["a1"], used_letters={"a": 1, "1": 1}).fingerprint is None
+
+
+@pytest.mark.usefixtures("dict_with_testwords")
 def test_solve_qless_all_words() -> None:
     """Test the solve_qless function with all_words=True."""
-    # Add test words to the dictionary
-    add_custom_words({"cat", "dog", "bat"})
-
     # Test with letters that can form "cat", "dog", and "bat"
     letters = "catdogbatxyz"
     result = solve_qless(letters, min_word_length=3, all_words=True)
@@ -68,6 +76,44 @@ def test_find_complete_solutions() -> None:
     assert found_solution, "No solution found with both 'cat' and 'dog'"
 
 
+def test_find_complete_solutions_expands_anagrams() -> None:
+    """Test that anagrams searched as one move are all returned."""
+    solutions = find_complete_solutions({"eat", "tea", "ate"}, Counter("eat"), 3)
+
+    assert sorted(solution.words for solution in solutions) == [
+        ["ate"],
+        ["eat"],
+        ["tea"],
+    ]
+
+
+def test_find_complete_solutions_returns_each_combination_once() -> None:
+    """Test that every word combination comes back once, in candidate order."""
+    solutions = find_complete_solutions({"cat", "act"}, Counter("catcat"), 3)
+
+    # Reusing a word or swapping two anagrams gives no extra orderings
+    assert [solution.words for solution in solutions] == [
+        ["act", "act"],
+        ["act", "cat"],
+        ["cat", "cat"],
+    ]
+
+    # This roll has combinations whose words share the rarest letter, which
+    # the search reaches in more than one order
+    solutions = solve_qless("lkrrrkwttioa")
+    combinations = {tuple(sorted(solution.words)) for solution in solutions}
+    assert len(solutions) == len(combinations) > 0
+
+
+def test_find_complete_solutions_do_not_share_used_letters() -> None:
+    """Test that each solution gets its own used_letters dict."""
+    solutions = find_complete_solutions({"eat", "tea", "ate"}, Counter("eat"), 3)
+
+    solutions[0].used_letters["e"] = 0
+
+    assert all(solution.used_letters["e"] == 1 for solution in solutions[1:])
+
+
 def test_solve_qless_with_all_words() -> None:
     """Test that solve_qless returns valid solutions when all_words=True."""
     # Test with a simple input
@@ -90,9 +136,10 @@ def test_solve_qless_complete() -> None:
     assert len(solutions) > 0
 
     # Each solution should use exactly the letters provided
+    expected = letter_mask("cathateatrat")
     for solution in solutions:
-        used_letters = "".join(solution.words)
-        assert Counter(used_letters.lower()) == Counter("cathateatrat")
+        assert letter_mask("".join(solution.words)) == expected
+        assert solution.fingerprint == expected
 
 
 def test_solution_iteration() -> None:
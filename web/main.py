@@ -1,11 +1,15 @@
+import functools
+import io
 import os
 import sys
-from typing import List
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
 
 from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile
-from fastapi.responses import HTMLResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, Response
 from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 DEFAULT_GRIDS = [
     [
@@ -48,18 +52,41 @@ if cli_path not in sys.path:
     sys.path.insert(0, cli_path)
 
 try:
+    from qless_solver.dictionary import load_dictionary
     from qless_solver.grid_solver import Grid, GridSolution, solve_qless_grid
     from qless_solver.image_detection import detect_letters
 except ImportError as e:
     print(f"Error importing solver modules: {e}")
     # Handle as appropriate, e.g. by disabling features or raising an error at startup
+    load_dictionary = None
     solve_qless_grid = None
     GridSolution = None
     Grid = None
     detect_letters = None
 
 
-app = FastAPI(title="Q-less Solver UI & API")
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Load the word dictionary before serving, not on the first solve."""
+    if load_dictionary is not None:
+        await run_in_threadpool(load_dictionary)
+    yield
+
+
+app = FastAPI(title="Q-less Solver UI & API", lifespan=lifespan)
+
+# Uploads are read in pieces of this size so one large photo does not hold
+# the event loop for a single whole-file copy
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# The solver already returns validated models, so the JSON API dumps them
+# straight to bytes instead of having FastAPI validate them again
+_SOLUTIONS_ADAPTER = TypeAdapter(List[GridSolution])
+
+# Solving is deterministic and the app never changes the dictionary, so
+# finished responses are cached per letters and minimum word length. Only
+# the rendered text is kept, not the solution models.
+RESPONSE_CACHE_SIZE = 128
 
 # Setup Jinja2 templates
 templates = Jinja2Templates(
@@ -67,6 +94,25 @@ templates = Jinja2Templates(
 )
 
 
+@functools.lru_cache(maxsize=RESPONSE_CACHE_SIZE)
+def _render_solutions(letters: str, min_word_length: int) -> str:
+    """Solve and render the results snippet. Errors propagate uncached."""
+    solutions = solve_qless_grid(letters=letters, min_word_length=min_word_length)
+    return templates.get_template("results_snippet.html").render(
+        solutions=solutions,
+        error_message=None,
+        letters_submitted=letters,
+        min_word_length_submitted=min_word_length,
+    )
+
+
+@functools.lru_cache(maxsize=RESPONSE_CACHE_SIZE)
+def _solve_json(letters: str, min_word_length: int) -> bytes:
+    """Solve and serialize the solutions for the JSON API. Errors propagate uncached."""
+    solutions = solve_qless_grid(letters=letters, min_word_length=min_word_length)
+    return _SOLUTIONS_ADAPTER.dump_json(solutions)
+
+
 # This model is for the JSON API, which we might keep for programmatic access
 class SolveRequestBody(BaseModel):
     letters: str
@@ -97,23 +143,25 @@ async def solve_letters_htmx(
             status_code=500,
         )
 
-    solutions: List[GridSolution] = []
     error_message = None
     try:
-        solutions = solve_qless_grid(letters=letters, min_word_length=min_word_length)
+        # Solve off the event loop so other requests are served meanwhile
+        html = await run_in_threadpool(_render_solutions, letters, min_word_length)
     except FileNotFoundError as e:
         error_message = f"Dictionary file not found: {e}"
         print(error_message)  # Log it
     except Exception as e:
         error_message = f"An error occurred during solving: {str(e)}"
         print(error_message)  # Log it
+    else:
+        return HTMLResponse(html)
 
-    # Render an HTML snippet template with the solutions or error
+    # Render an HTML snippet template with the error
     return templates.TemplateResponse(
         "results_snippet.html",
         {
             "request": request,
-            "solutions": solutions,
+            "solutions": [],
             "error_message": error_message,
             "letters_submitted": letters,
             "min_word_length_submitted": min_word_length,
@@ -134,28 +182,28 @@ async def solve_letters_image(
             status_code=500,
         )
 
-    content = await image.read()
-    detected = detect_letters(content)
+    buffer = io.BytesIO()
+    while chunk := await image.read(UPLOAD_CHUNK_SIZE):
+        buffer.write(chunk)
+    detected = detect_letters(buffer.getvalue())
 
-    solutions: List[GridSolution] = []
     error_message = None
     try:
-        solutions = solve_qless_grid(
-            letters=detected,
-            min_word_length=min_word_length,
-        )
+        html = await run_in_threadpool(_render_solutions, detected, min_word_length)
     except FileNotFoundError as e:
         error_message = f"Dictionary file not found: {e}"
         print(error_message)
     except Exception as e:
         error_message = f"An error occurred during solving: {str(e)}"
         print(error_message)
-    # Render an HTML snippet template with the solutions or error
+    else:
+        return HTMLResponse(html)
+    # Render an HTML snippet template with the error
     return templates.TemplateResponse(
         "results_snippet.html",
         {
             "request": request,
-            "solutions": solutions,
+            "solutions": [],
             "error_message": error_message,
             "letters_submitted": detected,
             "min_word_length_submitted": min_word_length,
@@ -164,8 +212,13 @@ async def solve_letters_image(
 
 
 # Optional: Keep the JSON API endpoint if direct API access is also desired
-@app.post("/api/solve/", response_model=List[GridSolution], tags=["API"])
-async def solve_letters_api(request_body: SolveRequestBody) -> List[GridSolution]:
+@app.post(
+    "/api/solve/",
+    response_model=None,
+    responses={200: {"model": List[GridSolution]}},
+    tags=["API"],
+)
+async def solve_letters_api(request_body: SolveRequestBody) -> Response:
     """
     JSON API endpoint. Accepts a string of letters and an optional minimum word length.
     Returns a list of possible grid solutions.
@@ -176,10 +229,9 @@ async def solve_letters_api(request_body: SolveRequestBody) -> List[GridSolution
             detail="Solver function not available due to an import error.",
         )
     try:
-        solutions = solve_qless_grid(
-            letters=request_body.letters, min_word_length=request_body.min_word_length
+        content = await run_in_threadpool(
+            _solve_json, request_body.letters, request_body.min_word_length
         )
-        return solutions
     except FileNotFoundError as e:
         raise HTTPException(status_code=500, detail=f"Dictionary file not found: {e}")
     except Exception as e:
@@ -187,6 +239,7 @@ async def solve_letters_api(request_body: SolveRequestBody) -> List[GridSolution
         raise HTTPException(
             status_code=500, detail=f"An error occurred during solving: {str(e)}"
         )
+    return Response(content=content, media_type="application/json")
 
 
 # To run (from project root):